@@ -0,0 +1,75 @@
+import pytest
+
+from todoai_cli.cli_args import build_parser, mentions_config_option, parse_config_argv
+
+
+def test_flag_with_separate_value():
+    args = parse_config_argv(["--set-default-api-url", "http://x", "--show-config"])
+    assert args.set_default_api_url == "http://x"
+    assert args.show_config is True
+    assert args.reset_config is False
+    assert args.config_path is None
+
+
+def test_flag_with_inline_value():
+    args = parse_config_argv(["--config-path=/tmp/c.json", "--set-default-agent=bot"])
+    assert args.config_path == "/tmp/c.json"
+    assert args.set_default_agent == "bot"
+
+
+@pytest.mark.parametrize("argv", [
+    ["--set-default-api-url", ""],
+    ["--set-default-api-url="],
+    ["--set-default-agent"],
+    ["--set-default-agent", "--show-config"],
+])
+def test_missing_or_empty_value_falls_back(argv):
+    assert parse_config_argv(argv) is None
+
+
+@pytest.mark.parametrize("argv", [
+    ["--", "--show-config"],
+    ["--show-config", "--"],
+    ["--show-config", "--bogus"],
+    ["--show-config", "prompt"],
+    ["--show-conf"],
+    ["--show-config=1"],
+    ["--agent", "--reset-config"],
+    ["--config-path", "c.json"],
+    [],
+])
+def test_anything_but_config_commands_falls_back(argv):
+    assert parse_config_argv(argv) is None
+
+
+def test_matches_argparse_defaults():
+    args = parse_config_argv(["--reset-config"])
+    expected = build_parser().parse_args(["--reset-config"])
+    for name, value in vars(args).items():
+        assert getattr(expected, name) == value
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["--show-config"], True),
+    (["--show-conf"], True),
+    (["--config-path=c.json"], True),
+    (["--help"], True),
+    (["--agent", "bot", "prompt"], False),
+    (["--", "--show-config"], False),
+    (["--agent=--show-config"], False),
+    (["--prompt-like", "text"], False),
+])
+def test_mentions_config_option(argv, expected):
+    assert mentions_config_option(argv) is expected
+
+
+@pytest.mark.parametrize("argv", [
+    ["--", "--show-config"],
+    ["--agent", "bot", "--", "--reset-config"],
+    ["--path", "x", "hello"],
+    ["--agent=--show-config"],
+])
+def test_parser_choice_parses_like_full_parser(argv):
+    full = build_parser().parse_args(argv)
+    chosen = build_parser(include_config=mentions_config_option(argv)).parse_args(argv)
+    assert vars(chosen) == vars(full)
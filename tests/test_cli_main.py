@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from todoai_cli import cli
+
+
+@pytest.fixture
+def run_main(monkeypatch, tmp_path):
+    """Run cli.main() with argv; returns the args passed on to _async_main."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    seen = []
+
+    async def fake_async_main(cfg, args):
+        seen.append(args)
+
+    monkeypatch.setattr(cli, "_async_main", fake_async_main)
+
+    def run(*argv):
+        monkeypatch.setattr(cli.sys, "argv", ["todoai", *argv])
+        cli.main()
+        return seen[-1] if seen else None
+
+    return run
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "todoai-cli" / "config.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"default_api_url": "http://saved"}))
+    return path
+
+
+def test_config_command_is_handled(run_main, config_file, capsys):
+    assert run_main("--show-config") is None
+    assert "http://saved" in capsys.readouterr().out
+
+
+def test_empty_value_falls_through_to_full_parser(run_main):
+    args = run_main("--set-default-api-url", "")
+    assert args.set_default_api_url == ""
+    assert args.resume is None
+
+
+def test_config_flag_after_double_dash_is_prompt(run_main, config_file):
+    args = run_main("--", "--show-config")
+    assert args.prompt == ["--show-config"]
+    assert args.show_config is False
+
+
+def test_config_flag_as_option_value_is_usage_error(run_main, config_file):
+    with pytest.raises(SystemExit) as exc:
+        run_main("--agent", "--reset-config")
+    assert exc.value.code == 2
+    assert config_file.exists()
+
+
+def test_unknown_option_is_usage_error(run_main, config_file):
+    with pytest.raises(SystemExit) as exc:
+        run_main("--show-config", "--bogus")
+    assert exc.value.code == 2
+
+
+def test_config_command_mixed_with_run_options(run_main, config_file, capsys):
+    assert run_main("--agent", "bot", "--show-config") is None
+    assert "http://saved" in capsys.readouterr().out
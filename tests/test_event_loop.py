@@ -0,0 +1,21 @@
+import sys
+
+import pytest
+
+from todoai_cli.event_loop import run
+
+
+def test_coroutine_runs_without_an_active_exception():
+    async def exc_info():
+        return sys.exc_info()
+
+    assert run(exc_info()) == (None, None, None)
+
+
+def test_errors_are_not_chained_to_the_uvloop_import():
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError) as exc:
+        run(fail())
+    assert exc.value.__context__ is None
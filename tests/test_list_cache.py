@@ -0,0 +1,79 @@
+import pytest
+
+from todoai_cli import list_cache
+from todoai_cli.list_cache import ListCache
+
+PROJECTS = [{"id": "p1", "project": {"name": "One"}}]
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    def make(**kwargs):
+        return ListCache("http://api", "key", cache_dir=tmp_path, **kwargs)
+
+    return make
+
+
+def test_round_trip_between_instances(make_cache):
+    make_cache().put("projects", PROJECTS)
+    assert make_cache().get("projects") == PROJECTS
+    assert make_cache().path.suffix == ".json"
+
+
+def test_entries_expire_after_ttl(make_cache, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(list_cache.time, "time", lambda: now)
+    make_cache(ttl=300).put("projects", PROJECTS)
+
+    now += 300
+    assert make_cache(ttl=300).get("projects") == PROJECTS
+    now += 1
+    assert make_cache(ttl=300).get("projects") is None
+
+
+def test_invalidate_drops_only_that_list(make_cache):
+    cache = make_cache()
+    cache.put("projects", PROJECTS)
+    cache.put("agents", [{"name": "bot"}])
+    cache.invalidate("agents")
+
+    fresh = make_cache()
+    assert fresh.get("agents") is None
+    assert fresh.get("projects") == PROJECTS
+
+
+def test_read_false_still_stores(make_cache):
+    cache = make_cache(read=False)
+    cache.put("projects", PROJECTS)
+    assert cache.get("projects") is None
+    assert make_cache().get("projects") == PROJECTS
+
+
+def test_separate_file_per_api_key(make_cache, tmp_path):
+    make_cache().put("projects", PROJECTS)
+    other = ListCache("http://api", "other-key", cache_dir=tmp_path)
+    assert other.get("projects") is None
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b'{"projects": [12',
+    b"\x80\x81 not json",
+    b"[1, 2]",
+    b'{"projects": "oops"}',
+    b'{"projects": [1, "not a list"]}',
+    b'{"projects": [1, 2, 3]}',
+])
+def test_recovers_from_corrupt_or_truncated_file(make_cache, content):
+    cache = make_cache()
+    cache.path.write_bytes(content)
+    assert cache.get("projects") is None
+
+    cache.put("projects", PROJECTS)
+    assert make_cache().get("projects") == PROJECTS
+
+
+def test_file_is_private(make_cache):
+    cache = make_cache()
+    cache.put("agents", [{"name": "bot"}])
+    assert cache.path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,57 @@
+import signal
+
+import pytest
+
+from todoai_cli.watch import _sigint_scope
+
+
+@pytest.fixture(autouse=True)
+def restore_sigint():
+    saved = signal.getsignal(signal.SIGINT)
+    yield
+    signal.signal(signal.SIGINT, saved)
+
+
+def test_callback_receives_sigint():
+    calls = []
+    with _sigint_scope(lambda: calls.append(1)):
+        signal.raise_signal(signal.SIGINT)
+    assert calls == [1]
+
+
+def test_innermost_callback_wins():
+    calls = []
+    with _sigint_scope(lambda: calls.append("outer")):
+        with _sigint_scope(lambda: calls.append("inner")):
+            signal.raise_signal(signal.SIGINT)
+        signal.raise_signal(signal.SIGINT)
+    assert calls == ["inner", "outer"]
+
+
+def test_ignored_sigint_stays_ignored():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    with _sigint_scope(lambda: pytest.fail("ignored SIGINT was delivered")):
+        assert signal.getsignal(signal.SIGINT) is signal.SIG_IGN
+        signal.raise_signal(signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is signal.SIG_IGN
+
+
+def test_default_sigint_raises_keyboard_interrupt_without_callback():
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    with pytest.raises(KeyboardInterrupt):
+        with _sigint_scope():
+            signal.raise_signal(signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is signal.SIG_DFL
+
+
+def test_python_handler_is_called_and_restored():
+    calls = []
+
+    def handler(signum, frame):
+        calls.append(signum)
+
+    signal.signal(signal.SIGINT, handler)
+    with _sigint_scope():
+        signal.raise_signal(signal.SIGINT)
+    assert calls == [signal.SIGINT]
+    assert signal.getsignal(signal.SIGINT) is handler
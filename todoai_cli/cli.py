@@ -4,68 +4,164 @@ TODOforAI CLI - Create and manage todos
 Usage: todoai "prompt text" | echo "content" | todoai [options]
 """
 
-import argparse
-import asyncio
-import json
+import functools
 import os
 import sys
 import time
-import uuid
-from typing import Optional, List, Dict, Any
-
-from todoforai_edge.utils import findBy, async_request
-from todoforai_edge.types import ProjectListItem, AgentSettings
-from todoforai_edge.edge import TODOforAIEdge
-from todoforai_edge.config import Config as EdgeConfig
+from typing import TYPE_CHECKING, Iterator, Optional, List, Dict, Any
 
 from .config_store import TODOCLIConfig
-from .edge_client import init_edge
-from .project_selectors import (
-    select_project,
-    select_agent,
-    _get_display_name,
-    _get_item_id,
-)
-from .message_display import MessageDisplay
+from .fast_json import dumpb, dumps
+from .event_loop import run as run_event_loop
+from .message_display import MessageDisplay, BRAND_ORANGE, CYAN, DIM, RESET, SEPARATOR
 from .logo import print_logo
-from .watch import watch_todo as _watch_todo
-from .interactive import interactive_loop
-from .cli_args import build_parser, handle_config_commands, _format_path_with_tilde
-from .prompt_input import create_session, get_interactive_input
+from .cli_args import (
+    build_parser,
+    handle_config_commands,
+    mentions_config_option,
+    parse_config_argv,
+    _format_path_with_tilde,
+)
+
+# Heavy imports (todoforai_edge, prompt_toolkit) are deferred to the code paths
+# that use them so `--help` and config commands start fast.
+if TYPE_CHECKING:
+    import argparse
+    import asyncio
+    from .list_cache import ListCache
+    from todoforai_edge.types import ProjectListItem, AgentSettings
+    from todoforai_edge.edge import TODOforAIEdge
+
+
+# Local dev API servers, which map to the local frontend
+_LOCAL_API_HOSTS = frozenset({("localhost", 4000), ("127.0.0.1", 4000)})
+
+# MCP name under which workspace paths live in an agent's edge config
+_EDGE_MCP_KEY = "todoai_edge"
+
+
+def _iter_agent_workspace_paths(agent: dict) -> Iterator[str]:
+    """Yield workspace paths from an agent's edge configs."""
+    for edge_config in agent.get("edgesMcpConfigs", {}).values():
+        todoai_config = edge_config.get(_EDGE_MCP_KEY) or edge_config.get("todoai", {})
+        yield from todoai_config.get("workspacePaths", ())
 
 
 def _get_agent_workspace_paths(agent: dict) -> list:
     """Extract all workspace paths from an agent's edge configs."""
-    paths = []
-    for edge_config in agent.get("edgesMcpConfigs", {}).values():
-        todoai_config = edge_config.get("todoai_edge") or edge_config.get("todoai", {})
-        paths.extend(todoai_config.get("workspacePaths", []))
-    return paths
+    return list(_iter_agent_workspace_paths(agent))
+
+
+@functools.lru_cache(maxsize=512)
+def _realpath_cached(path: str) -> str:
+    """os.path.realpath, memoized: agents commonly share workspace roots."""
+    return os.path.realpath(path)
 
 
-def _find_agent_by_path(agents: list, path: str):
-    """Find agent whose workspacePaths contain the given path. Returns (agent, matched_workspace) or (None, None)."""
-    resolved = os.path.realpath(path)
+def _find_agent_by_name(agents: list, name: str):
+    """Find agent by case-insensitive exact name, else first substring match."""
+    from .project_selectors import _get_display_name
+
+    needle = name.lower()
+    agents_by_name: Dict[str, Any] = {}
+    for a in agents:
+        agents_by_name.setdefault(_get_display_name(a).lower(), a)
+    return agents_by_name.get(needle) or next(
+        (a for n, a in agents_by_name.items() if needle in n), None
+    )
+
+
+def _find_agent_by_path(agents: list, resolved: str):
+    """Find agent whose workspacePaths contain the given realpath. Returns (agent, matched_workspace) or (None, None)."""
     for agent in agents:
-        for wp in _get_agent_workspace_paths(agent):
-            wp_resolved = os.path.realpath(wp)
+        for wp in _iter_agent_workspace_paths(agent):
+            wp_resolved = _realpath_cached(wp)
             if resolved == wp_resolved:
                 return agent, wp_resolved
     return None, None
 
 
+class ListFetchError(Exception):
+    """A project or agent list couldn't be fetched.
+
+    Raised instead of exiting so a failing background fetch doesn't tear
+    down the event loop mid-prompt; _async_main reports it.
+    """
+
+
+def _read_piped_stdin() -> str:
+    """Read all of piped stdin as raw bytes and decode once."""
+    data = sys.stdin.buffer.read()
+    return data.decode("utf-8", errors="replace").strip() if data else ""
+
+
+def _start_piped_stdin_read() -> "asyncio.Future":
+    """Read piped stdin on a daemon thread; the future gets the text.
+
+    Unlike asyncio.to_thread, an early exit doesn't wait in the executor
+    join for a producer that is still writing. The thread uses os.read on
+    the fd rather than sys.stdin.buffer, whose lock it would otherwise hold
+    while the interpreter shuts down.
+    """
+    import asyncio
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _settle(text, exc):
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(text)
+
+    def _worker():
+        text = exc = None
+        try:
+            chunks = []
+            fd = sys.stdin.fileno()
+            while chunk := os.read(fd, 1 << 16):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+            text = data.decode("utf-8", errors="replace").strip() if data else ""
+        except Exception as e:
+            exc = e
+        try:
+            loop.call_soon_threadsafe(_settle, text, exc)
+        except RuntimeError:
+            pass  # Loop already closed: the run ended before stdin did
+
+    threading.Thread(target=_worker, name="todoai-stdin", daemon=True).start()
+    return future
+
+
 class TODOCLITool:
     def __init__(self, config: TODOCLIConfig, message_display: MessageDisplay = None):
         self.config = config
         self.edge = None
-        self.message_display = message_display or MessageDisplay()
-        self._embedded_edge: Optional[TODOforAIEdge] = None
-        self._embedded_edge_task: Optional[asyncio.Task] = None
+        self._frontend_base = "https://todofor.ai"
+        self._message_display = message_display
+        self._embedded_edge: Optional["TODOforAIEdge"] = None
+        self._embedded_edge_task: Optional["asyncio.Task"] = None
+        self._list_cache: Optional["ListCache"] = None
+        self._cached_lists = set()  # Names of lists last served from the cache
+
+    @property
+    def message_display(self) -> MessageDisplay:
+        """Created on first use; only resumed todos display message history."""
+        if self._message_display is None:
+            self._message_display = MessageDisplay()
+        return self._message_display
 
     async def init_edge(
         self, api_url: Optional[str] = None, skip_validation: bool = False
     ):
         """Initialize TODOforAI Edge client"""
+        from urllib.parse import urlsplit
+        from .edge_client import init_edge
+
         self.edge = await init_edge(
             api_url,
             self.config.data.get("default_api_url"),
@@ -73,37 +169,59 @@ class TODOCLITool:
             skip_validation=skip_validation,
         )
 
+        # Map API URL to frontend URL once
+        parts = urlsplit(self.edge.api_url)
+        try:
+            host_port = (parts.hostname, parts.port)
+        except ValueError:  # Invalid port
+            host_port = None
+        if host_port in _LOCAL_API_HOSTS:
+            self._frontend_base = "http://localhost:3000"
+        else:
+            # Production or other environments
+            self._frontend_base = "https://todofor.ai"
+
     async def start_embedded_edge(self, workspace_path: str = "/tmp/todoforai"):
-        """Start an embedded edge runtime for local block execution."""
+        """Start an embedded edge runtime for local block execution.
+
+        workspace_path must already be absolute; callers resolve it once.
+        """
+        import asyncio
+        from todoforai_edge.config import Config as EdgeConfig
+        from .edge_client import EmbeddedEdge
+
         cfg = EdgeConfig()
         cfg.api_url = self.edge.api_url
         cfg.api_key = self.edge.api_key
 
-        self._embedded_edge = TODOforAIEdge(cfg)
+        edge_ready = asyncio.Event()
+        self._embedded_edge = EmbeddedEdge(cfg, edge_ready)
         await self._embedded_edge.ensure_api_key(prompt_if_missing=False)
 
         # Add workspace path so the edge knows where to execute
         if workspace_path:
-            self._embedded_edge.add_workspace_path = os.path.abspath(workspace_path)
+            self._embedded_edge.add_workspace_path = workspace_path
 
         # Start the edge in the background (it runs a reconnect loop)
         self._embedded_edge_task = asyncio.create_task(self._embedded_edge.start())
 
-        # Wait for the edge to connect and get its edge_id
-        for _ in range(50):  # up to 5 seconds
-            if self._embedded_edge.edge_id:
-                print(
-                    f"Embedded edge running (id: {self._embedded_edge.edge_id})",
-                    file=sys.stderr,
-                )
-                return
-            await asyncio.sleep(0.1)
-
-        print("Warning: Embedded edge did not get an edge_id in time", file=sys.stderr)
+        # Wait (up to 5 seconds) for the edge to connect and get its edge_id
+        try:
+            await asyncio.wait_for(edge_ready.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            print("Warning: Embedded edge did not get an edge_id in time", file=sys.stderr)
+            return
+
+        print(
+            f"Embedded edge running (id: {self._embedded_edge.edge_id})",
+            file=sys.stderr,
+        )
 
     async def stop_embedded_edge(self):
         """Stop the embedded edge runtime."""
         if self._embedded_edge_task:
+            import asyncio
+
             self._embedded_edge_task.cancel()
             try:
                 await self._embedded_edge_task
@@ -112,10 +230,15 @@ class TODOCLITool:
             self._embedded_edge_task = None
         self._embedded_edge = None
 
-    async def read_stdin(self) -> str:
-        """Read content from stdin or prompt for interactive input"""
-        if sys.stdin.isatty():
+    async def read_stdin(self, piped: "Optional[asyncio.Future]" = None) -> str:
+        """Read content from stdin or prompt for interactive input
+
+        piped is a read of piped stdin already started with _start_piped_stdin_read.
+        """
+        if piped is None and sys.stdin.isatty():
             # Interactive mode - use prompt_toolkit so multiline paste is preserved
+            from .prompt_input import create_session, get_interactive_input
+
             try:
                 session = create_session()
                 content = await get_interactive_input(session, "TODO> ")
@@ -130,31 +253,47 @@ class TODOCLITool:
             return content
         else:
             # Piped input mode
-            content = sys.stdin.read().strip()
+            content = await piped if piped is not None else _read_piped_stdin()
             if not content:
                 print("Error: Empty input", file=sys.stderr)
                 sys.exit(1)
 
             return content
 
-    async def get_projects(self) -> List[ProjectListItem]:
+    async def _get_list(self, name: str, fetch, fresh: bool) -> list:
+        """Serve a list from the list cache (unless fresh) or fetch and store it."""
+        cache = self._list_cache
+        if cache is not None and not fresh:
+            items = cache.get(name)
+            if items is not None:
+                self._cached_lists.add(name)
+                return items
+        self._cached_lists.discard(name)
+        items = await fetch()
+        if cache is not None:
+            cache.put(name, items)
+        return items
+
+    async def get_projects(self, fresh: bool = False) -> List["ProjectListItem"]:
         """Get available projects"""
         try:
-            return await self.edge.list_projects()
+            return await self._get_list("projects", self.edge.list_projects, fresh)
         except Exception as e:
-            print(f"Error: Failed to fetch projects: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise ListFetchError(f"Failed to fetch projects: {e}") from e
 
-    async def get_agents(self) -> List[AgentSettings]:
+    async def get_agents(self, fresh: bool = False) -> List["AgentSettings"]:
         """Get available agent settings"""
         try:
-            return await self.edge.list_agent_settings()
+            return await self._get_list("agents", self.edge.list_agent_settings, fresh)
         except Exception as e:
-            print(f"Error: Failed to fetch agents: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise ListFetchError(f"Failed to fetch agents: {e}") from e
+
+    def _invalidate_list(self, name: str):
+        if self._list_cache is not None:
+            self._list_cache.invalidate(name)
 
     async def create_todo(
-        self, content: str, project_id: str, agent: AgentSettings
+        self, content: str, project_id: str, agent: "AgentSettings"
     ) -> Dict[str, Any]:
         try:
             return await self.edge.add_message(
@@ -177,6 +316,8 @@ class TODOCLITool:
         activity_event=None,
     ) -> bool:
         """Watch todo execution. Delegates to watch module."""
+        from .watch import watch_todo as _watch_todo
+
         return await _watch_todo(
             self.edge,
             todo_id,
@@ -195,6 +336,8 @@ class TODOCLITool:
         self, todo_id: str, timeout: int, json_output: bool, auto_approve: bool = False
     ):
         """Resume an existing todo - show history and enter interactive mode"""
+        from .interactive import interactive_loop
+
         # Fetch existing todo with messages
         todo = await self.edge.get_todo(todo_id)
         project_id = todo.get("projectId")
@@ -204,7 +347,7 @@ class TODOCLITool:
         messages = todo.get("messages", [])
         self.message_display.display_messages(messages)
 
-        print("\n" + "─" * 40, file=sys.stderr)
+        print(f"\n{SEPARATOR}", file=sys.stderr)
         print(f"Resumed todo: {todo_id}", file=sys.stderr)
 
         async def _watch(interrupt_on_cancel=True, suppress_cancel_notice=False, activity_event=None):
@@ -225,45 +368,50 @@ class TODOCLITool:
         await interactive_loop(_watch, _send)
 
     def _get_frontend_url(self, project_id: str, todo_id: str) -> str:
-        api_url = self.edge.api_url
-
-        # Map API URLs to frontend URLs
-        if "localhost:4000" in api_url or "127.0.0.1:4000" in api_url:
-            return f"http://localhost:3000/{project_id}/{todo_id}"
-        else:
-            # Production or other environments
-            return f"https://todofor.ai/{project_id}/{todo_id}"
+        return f"{self._frontend_base}/{project_id}/{todo_id}"
 
     async def _auto_create_agent(self, resolved_path: str, agents: list) -> dict:
         """Create a new agent with workspace path configured. Returns agent dict."""
-        folder_name = os.path.basename(resolved_path) or "default"
+        import asyncio
+        from todoforai_edge.utils import async_request
+        from .project_selectors import _get_item_id
 
-        # 1. Create agent
-        resp = (await async_request(self.edge, "post", "/api/v1/agents", {})).json()
-        agent_id = resp.get("id") or resp.get("agentSettingsId")
-        if not agent_id:
-            raise RuntimeError(f"Failed to create agent: {resp}")
-        agent_settings_id = resp.get("agentSettingsId", agent_id)
+        folder_name = os.path.basename(resolved_path) or "default"
 
-        # 2. Set name
-        await async_request(
-            self.edge,
-            "put",
-            f"/api/v1/agents/{agent_id}/settings",
-            {"agentSettingsId": agent_settings_id, "updates": {"name": folder_name}},
+        # Find edge ID: reuse from existing agents, or fetch /edges. The fetch
+        # doesn't depend on the new agent, so it overlaps with steps 1-2.
+        edge_id = next(
+            (eid for a in agents for eid in a.get("edgesMcpConfigs", {})), None
         )
-
-        # 3. Find edge ID: reuse from existing agents, or fetch /edges
-        edge_id = None
-        for a in agents:
-            keys = list(a.get("edgesMcpConfigs", {}).keys())
-            if keys:
-                edge_id = keys[0]
-                break
+        edges_task = None
         if not edge_id:
-            edges = (
-                await async_request(self.edge, "get", "/api/v1/edges", None)
-            ).json()
+            edges_task = asyncio.create_task(
+                async_request(self.edge, "get", "/api/v1/edges", None)
+            )
+
+        try:
+            # 1. Create agent
+            resp = (await async_request(self.edge, "post", "/api/v1/agents", {})).json()
+            agent_id = resp.get("id") or resp.get("agentSettingsId")
+            if not agent_id:
+                raise RuntimeError(f"Failed to create agent: {resp}")
+            agent_settings_id = resp.get("agentSettingsId", agent_id)
+
+            # 2. Set name
+            await async_request(
+                self.edge,
+                "put",
+                f"/api/v1/agents/{agent_id}/settings",
+                {"agentSettingsId": agent_settings_id, "updates": {"name": folder_name}},
+            )
+        except BaseException:
+            if edges_task:
+                edges_task.cancel()
+            raise
+
+        # 3. Collect the edge ID fetched in the background
+        if edges_task:
+            edges = (await edges_task).json()
             if edges and isinstance(edges, list):
                 edge_id = edges[0].get("id")
         if not edge_id:
@@ -277,69 +425,129 @@ class TODOCLITool:
             {
                 "agentSettingsId": agent_settings_id,
                 "edgeId": edge_id,
-                "mcpName": "todoai_edge",
+                "mcpName": _EDGE_MCP_KEY,
                 "config": {"workspacePaths": [resolved_path]},
             },
         )
 
-        # 5. Re-fetch full agent from server (has ownerId etc.)
-        all_agents = await self.get_agents()
-        for a in all_agents:
-            if _get_item_id(a) == agent_id:
-                return a
-        # Fallback: return create response merged with essentials
-        resp["name"] = folder_name
-        resp["edgesMcpConfigs"] = {
-            edge_id: {
-                "todoai_edge": {"workspacePaths": [resolved_path]}
-            }
+        # 5. Build the agent from the create response plus what we just set
+        agent = {
+            **resp,
+            "id": agent_id,
+            "agentSettingsId": agent_settings_id,
+            "name": folder_name,
+            "edgesMcpConfigs": {
+                edge_id: {
+                    _EDGE_MCP_KEY: {"workspacePaths": [resolved_path]}
+                }
+            },
         }
-        return resp
+        if "ownerId" in resp:
+            return agent
+
+        # Response lacks server-side fields: re-fetch full agent from server
+        all_agents = await self.get_agents(fresh=True)
+        return next((a for a in all_agents if _get_item_id(a) == agent_id), agent)
 
     async def run(self, args):
         """Main execution"""
+        import asyncio
+        from todoforai_edge.utils import async_request
+        from .project_selectors import select_project, select_agent, _get_display_name, _get_item_id
+        from .interactive import interactive_loop
+
         # Init edge with URL priority: --api-url > env (inside Edge Config) > config default > package default
         await self.init_edge(args.api_url, skip_validation=not args.safe)
 
+        # Reuse recently fetched lists across runs; --safe always refetches
+        from .list_cache import ListCache
+
+        self._list_cache = ListCache(self.edge.api_url, self.edge.api_key, read=not args.safe)
+
+        # Config values used by the selection logic below. The default agent is
+        # only overwritten together with pre_matched_agent, which wins anyway.
+        cfg_data = self.config.data
+        default_project_id = cfg_data.get("default_project_id")
+        default_project_name = cfg_data.get("default_project_name")
+        default_agent_name = cfg_data.get("default_agent_name")
+        stored_agent = cfg_data.get("default_agent_settings")
+
+        # Lists are only fetched when no saved default or CLI argument can be
+        # used; --safe (and --debug) force both fetches. The project list
+        # doesn't depend on the agent, so fetch it in the background while
+        # the edge starts and the prompt is read.
+        force_fetch = args.safe or args.debug
+        need_projects = force_fetch or not (args.project or default_project_id)
+        projects_task = None
+        if need_projects:
+            projects_task = asyncio.create_task(self.get_projects())
+            # Mark a failure as seen if we exit before awaiting the task
+            projects_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        # Likewise drain piped input on a daemon thread during the agent
+        # lookup; a terminal prompt still waits for the agent line below.
+        piped_stdin = None
+        if not args.prompt and not sys.stdin.isatty():
+            piped_stdin = _start_piped_stdin_read()
+
         # Start embedded edge if --edge flag is set
-        if args.edge is not None:
-            await self.start_embedded_edge(workspace_path=os.path.abspath(args.edge))
+        edge_abs = os.path.abspath(args.edge) if args.edge is not None else None
+        if edge_abs is not None:
+            await self.start_embedded_edge(workspace_path=edge_abs)
 
         # Pre-resolve agent BEFORE prompting for input (by --agent name or workspace path)
-        pre_matched_agent = None
+        pre_matched_agent = agent_name = None
         agents = None
+        matched_from_cache = False
         if args.agent:
             agents = await self.get_agents()
-            pre_matched_agent = findBy(
-                agents, lambda a: args.agent.lower() in _get_display_name(a).lower()
-            )
+            pre_matched_agent = _find_agent_by_name(agents, args.agent)
+            if not pre_matched_agent and "agents" in self._cached_lists:
+                # The cached list may predate the agent; check the server
+                agents = await self.get_agents(fresh=True)
+                pre_matched_agent = _find_agent_by_name(agents, args.agent)
             if not pre_matched_agent:
-                print(f"Error: Agent '{args.agent}' not found", file=sys.stderr)
-                print("Available agents:", file=sys.stderr)
-                for a in agents:
-                    print(f"  - {_get_display_name(a)}", file=sys.stderr)
+                lines = [f"Error: Agent '{args.agent}' not found", "Available agents:"]
+                lines.extend(f"  - {_get_display_name(a)}" for a in agents)
+                sys.stderr.write("\n".join(lines) + "\n")
                 sys.exit(1)
-            self.config.set_default_agent(_get_display_name(pre_matched_agent), pre_matched_agent)
+            agent_name = _get_display_name(pre_matched_agent)
+            matched_from_cache = "agents" in self._cached_lists
+            self.config.set_default_agent(agent_name, pre_matched_agent)
         elif args.path:
             agents = await self.get_agents()
-            agent, matched_wp = _find_agent_by_path(agents, args.path)
+            resolved = os.path.realpath(args.path)
+            agent, matched_wp = _find_agent_by_path(agents, resolved)
+            if not agent and "agents" in self._cached_lists:
+                # Never auto-create a duplicate because of a stale cache
+                agents = await self.get_agents(fresh=True)
+                agent, matched_wp = _find_agent_by_path(agents, resolved)
             if agent:
-                self.config.set_default_agent(_get_display_name(agent), agent)
+                agent_name = _get_display_name(agent)
+                matched_from_cache = "agents" in self._cached_lists
+                self.config.set_default_agent(agent_name, agent)
                 pre_matched_agent = agent
             else:
-                resolved = os.path.realpath(args.path)
                 print(
                     f"No agent found for '{_format_path_with_tilde(resolved)}', creating one...", file=sys.stderr
                 )
                 try:
                     pre_matched_agent = await self._auto_create_agent(resolved, agents)
-                    self.config.set_default_agent(
-                        pre_matched_agent["name"], pre_matched_agent
-                    )
+                    self._invalidate_list("agents")
+                    agent_name = pre_matched_agent["name"]
+                    self.config.set_default_agent(agent_name, pre_matched_agent)
                 except Exception as e:
                     print(f"Error: Failed to auto-create agent: {e}", file=sys.stderr)
                     sys.exit(1)
 
+        # A cached list only resolves --agent/--path to an agent id. Its
+        # settings may be stale, so fetch current ones while the prompt is
+        # read; those are what gets saved as the default and sent with the todo.
+        agents_refresh = None
+        if matched_from_cache:
+            agents_refresh = asyncio.create_task(self.get_agents(fresh=True))
+            agents_refresh.add_done_callback(lambda t: t.cancelled() or t.exception())
+
         if pre_matched_agent:
             paths = _get_agent_workspace_paths(pre_matched_agent)
             path_label = "Path" if len(paths) == 1 else "Paths"
@@ -347,47 +555,62 @@ class TODOCLITool:
                 path_str = _format_path_with_tilde(paths[0])
             else:
                 path_str = str([_format_path_with_tilde(p) for p in paths])
-            print(
-                f"\033[90mAgent:\033[0m \033[38;2;249;110;46m{_get_display_name(pre_matched_agent)}\033[0m \033[90m│ {path_label}:\033[0m \033[36m{path_str}\033[0m",
-                file=sys.stderr,
-            )
+            if sys.stderr.isatty():
+                msg = f"{DIM}Agent:{RESET} {BRAND_ORANGE}{agent_name}{RESET} {DIM}│ {path_label}:{RESET} {CYAN}{path_str}{RESET}"
+            else:
+                msg = f"Agent: {agent_name} │ {path_label}: {path_str}"
+            print(msg, file=sys.stderr)
 
         # Read content from positional prompt args, stdin, or interactive input
         if args.prompt:
             content = " ".join(args.prompt)
         else:
-            content = await self.read_stdin()
+            content = await self.read_stdin(piped_stdin)
 
-        # Check if we can skip fetching lists (have defaults or CLI args)
-        has_project = args.project or self.config.data.get("default_project_id")
+        # Check if we can skip fetching the agent list (have defaults or CLI args).
         # For agent, we need full settings with id - name alone isn't enough
         # If --agent flag provided, we must fetch to get full settings
-        stored_agent = self.config.data.get("default_agent_settings")
         has_agent = pre_matched_agent or (
             (stored_agent and stored_agent.get("id")) and not args.agent
         )
 
-        # Only fetch lists if needed for selection (or --safe mode)
-        projects = None
-        if not has_project or not has_agent or args.safe or args.debug:
-            projects = await self.get_projects()
-            if not agents:
-                agents = await self.get_agents()
+        fetches = {}
+        if projects_task:
+            fetches["projects"] = projects_task
+        if agents_refresh:
+            fetches["agents"] = agents_refresh
+        elif not agents and (force_fetch or not has_agent):
+            # The picked agent's settings are saved and sent, so skip the cache
+            fetches["agents"] = self.get_agents(fresh=True)
+        fetched = dict(zip(fetches, await asyncio.gather(*fetches.values())))
+        projects = fetched.get("projects")
+        agents = fetched.get("agents", agents)
+
+        if agents_refresh:
+            agent_id = _get_item_id(pre_matched_agent)
+            pre_matched_agent = next(
+                (a for a in agents if _get_item_id(a) == agent_id), pre_matched_agent
+            )
+            self.config.set_default_agent(agent_name, pre_matched_agent)
 
         # Remove DEBUG prints for cleaner output
         if args.debug and projects and agents:
-            print("DEBUG - Projects structure:", file=sys.stderr)
+            buf = ["DEBUG - Projects structure:"]
             for i, project in enumerate(projects[:2]):  # Only first 2 to avoid spam
-                print(f"Project {i}: {json.dumps(project, indent=2)}", file=sys.stderr)
-            print("DEBUG - Agents structure:", file=sys.stderr)
+                buf.append(f"Project {i}: {dumps(project, indent=True)}")
+            buf.append("DEBUG - Agents structure:")
             for i, agent in enumerate(agents[:2]):  # Only first 2 to avoid spam
-                print(f"Agent {i}: {json.dumps(agent, indent=2)}", file=sys.stderr)
-            print("=" * 50, file=sys.stderr)
+                buf.append(f"Agent {i}: {dumps(agent, indent=True)}")
+            buf.append("=" * 50)
+            sys.stderr.write("\n".join(buf) + "\n")
 
         # Select project
         if args.project:
             if projects:
-                project = findBy(projects, lambda p: _get_item_id(p) == args.project)
+                project = next((p for p in projects if _get_item_id(p) == args.project), None)
+                if not project and "projects" in self._cached_lists:
+                    projects = await self.get_projects(fresh=True)
+                    project = next((p for p in projects if _get_item_id(p) == args.project), None)
                 if not project:
                     print(
                         f"Error: Project ID '{args.project}' not found", file=sys.stderr
@@ -399,14 +622,14 @@ class TODOCLITool:
                 )
             else:
                 project_id, project_name = args.project, args.project
-        elif self.config.data.get("default_project_id") and not projects:
+        elif default_project_id and not projects:
             # Fast path: use default without fetching list
-            project_id = self.config.data.get("default_project_id")
-            project_name = self.config.data.get("default_project_name") or project_id
+            project_id = default_project_id
+            project_name = default_project_name or project_id
         else:
             project_id, project_name = select_project(
                 projects,
-                default_project_id=self.config.data.get("default_project_id"),
+                default_project_id=default_project_id,
                 set_default=self.config.set_default_project,
             )
 
@@ -419,61 +642,79 @@ class TODOCLITool:
         else:
             agent = select_agent(
                 agents,
-                default_agent_name=self.config.data.get("default_agent_name"),
+                default_agent_name=default_agent_name,
                 set_default=self.config.set_default_agent,
             )
 
-        # Generate TODO ID if not provided
-        todo_id = args.todo_id or str(uuid.uuid4())
-
         # Register embedded edge with the agent settings on the server so the
         # server-side agent can discover it and generate blocks for execution.
+        # The PUT runs concurrently with creating the TODO.
+        register_task = None
         if self._embedded_edge and self._embedded_edge.edge_id:
             edge_id = self._embedded_edge.edge_id
             agent_id = agent.get("id", "")
-            wp = os.path.abspath(args.edge) if args.edge else "."
             edge_mcp_config = {
-                "workspacePaths": [wp],
+                "workspacePaths": [edge_abs or "."],
             }
             # Update server-side agent settings
-            try:
-                await async_request(
+            register_task = asyncio.create_task(
+                async_request(
                     self.edge,
                     "put",
                     f"/api/v1/agents/{agent_id}/edge-mcp-config",
                     {
                         "agentSettingsId": agent_id,
                         "edgeId": edge_id,
-                        "mcpName": "todoai_edge",
+                        "mcpName": _EDGE_MCP_KEY,
                         "config": edge_mcp_config,
                     },
                 )
+            )
+            # Also update local dict for watch_todo
+            configs = agent.get("edgesMcpConfigs")
+            if configs is None:
+                configs = agent["edgesMcpConfigs"] = {}
+            configs[edge_id] = {_EDGE_MCP_KEY: edge_mcp_config}
+
+        # Create TODO
+        todo = await self.create_todo(content, project_id, agent)
+
+        if register_task:
+            try:
+                await register_task
+                self._invalidate_list("agents")
                 print(f"Registered edge {edge_id} with agent settings", file=sys.stderr)
             except Exception as e:
                 print(
                     f"Warning: Failed to register edge with agent: {e}", file=sys.stderr
                 )
-            # Also update local dict for watch_todo
-            configs = agent.get("edgesMcpConfigs") or {}
-            configs[edge_id] = {"todoai_edge": edge_mcp_config}
-            agent["edgesMcpConfigs"] = configs
 
-        # Create TODO
-        todo = await self.create_todo(content, project_id, agent)
+        # Get the actual todo ID from response; only make one up if it has none
+        actual_todo_id = todo.get("id") or args.todo_id
+        if not actual_todo_id:
+            import uuid
 
-        # Get the actual todo ID from response
-        actual_todo_id = todo.get("id", todo_id)
-        self.config.data["last_todo_id"] = actual_todo_id
-        self.config.save_config()
+            actual_todo_id = str(uuid.uuid4())
+        self.config.set_last_todo_id(actual_todo_id)
+        # Persist the selection and last todo now rather than after the session
+        self.config.flush()
         frontend_url = self._get_frontend_url(project_id, actual_todo_id)
 
         # Output result
         if args.json:
-            todo_with_url = todo.copy()
-            todo_with_url["frontend_url"] = frontend_url
-            print(json.dumps(todo_with_url, indent=2))
+            data = dumpb({**todo, "frontend_url": frontend_url}, indent=True) + b"\n"
+            raw = getattr(sys.stdout, "buffer", None)
+            if raw is not None:
+                sys.stdout.flush()
+                raw.write(data)
+                raw.flush()
+            else:
+                sys.stdout.write(data.decode("utf-8"))
         else:
-            print(f"\033[90mTODO:\033[0m \033[36m{frontend_url}\033[0m", file=sys.stderr)
+            if sys.stderr.isatty():
+                print(f"{DIM}TODO:{RESET} {CYAN}{frontend_url}{RESET}", file=sys.stderr)
+            else:
+                print(f"TODO: {frontend_url}", file=sys.stderr)
 
         # Watch for completion (default behavior)
         auto_approve = args.edge is not None or args.skip_permissions
@@ -489,20 +730,23 @@ class TODOCLITool:
                 # Each watch_todo returns after one turn (todo:msg_done).
                 # We re-watch with a short idle timeout: if a new turn starts
                 # within IDLE_TIMEOUT seconds, continue; otherwise we're done.
+                from .watch import _sigint_scope
+
                 IDLE_TIMEOUT = 60
                 deadline = time.monotonic() + args.timeout
-                try:
-                    await _do_watch(args.timeout)
-                except asyncio.TimeoutError:
-                    print(f"\nTimeout after {args.timeout}s", file=sys.stderr)
-                # Subsequent turns: use short idle timeout
-                while time.monotonic() < deadline:
-                    remaining = deadline - time.monotonic()
+                with _sigint_scope():
                     try:
-                        if not await _do_watch(min(IDLE_TIMEOUT, int(max(remaining, 1)))):
-                            break
+                        await _do_watch(args.timeout)
                     except asyncio.TimeoutError:
-                        break  # idle timeout — no more turns coming
+                        print(f"\nTimeout after {args.timeout}s", file=sys.stderr)
+                    # Subsequent turns: use short idle timeout
+                    while time.monotonic() < deadline:
+                        remaining = deadline - time.monotonic()
+                        try:
+                            if not await _do_watch(min(IDLE_TIMEOUT, int(max(remaining, 1)))):
+                                break
+                        except asyncio.TimeoutError:
+                            break  # idle timeout — no more turns coming
             else:
                 try:
                     await _do_watch(args.timeout)
@@ -511,7 +755,7 @@ class TODOCLITool:
 
         # Interactive mode (default) - continue conversation
         if not args.non_interactive and not args.no_watch:
-            print("\n" + "─" * 40, file=sys.stderr)
+            print(f"\n{SEPARATOR}", file=sys.stderr)
 
             async def _watch(interrupt_on_cancel=True, suppress_cancel_notice=False, activity_event=None):
                 return await self.watch_todo(
@@ -542,8 +786,16 @@ class TODOCLITool:
 
 
 def main():
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+
+    # Plain config commands skip argparse entirely. Anything else, including
+    # a config command that turns out to be a no-op, gets the full parser.
+    args = parse_config_argv(argv)
+    if args is not None and handle_config_commands(
+        TODOCLIConfig(path_arg=args.config_path), args
+    ):
+        return
+    args = build_parser(include_config=mentions_config_option(argv)).parse_args(argv)
 
     # Build config (with optional custom path)
     cfg = TODOCLIConfig(path_arg=args.config_path)
@@ -558,12 +810,12 @@ def main():
 
     # Main async execution
     try:
-        asyncio.run(_async_main(cfg, args))
+        run_event_loop(_async_main(cfg, args))
     except (KeyboardInterrupt, SystemExit):
         pass
 
 
-async def _async_main(cfg: TODOCLIConfig, args: argparse.Namespace) -> None:
+async def _async_main(cfg: TODOCLIConfig, args: "argparse.Namespace") -> None:
     """Async entry point for the main CLI workflow."""
     tool = TODOCLITool(cfg)
 
@@ -592,7 +844,13 @@ async def _async_main(cfg: TODOCLIConfig, args: argparse.Namespace) -> None:
         finally:
             await tool.stop_embedded_edge()
     else:
-        await tool.run(args)
+        # Selection updates several defaults; write the config once for them
+        with cfg.batch():
+            try:
+                await tool.run(args)
+            except ListFetchError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 """Argparse builder and config command handling."""
 
-import argparse
-import asyncio
-import json
 import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import argparse
 
 
 def _format_path_with_tilde(path: str) -> str:
@@ -15,8 +17,136 @@ def _format_path_with_tilde(path: str) -> str:
     return path_str
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the CLI argument parser."""
+# Flags handled by handle_config_commands(); used to scan argv before
+# deciding which parser to build.
+CONFIG_FLAGS = frozenset({
+    "--set-defaults",
+    "--set-default-project",
+    "--set-default-agent",
+    "--set-default-api-url",
+    "--set-default-api-key",
+    "--show-config",
+    "--reset-config",
+})
+
+
+# Config options that take a value (the rest of CONFIG_FLAGS are switches)
+_CONFIG_VALUE_FLAGS = frozenset({
+    "--config-path",
+    "--set-default-project",
+    "--set-default-agent",
+    "--set-default-api-url",
+    "--set-default-api-key",
+})
+
+
+_CONFIG_DEFAULT_FLAGS = CONFIG_FLAGS | _CONFIG_VALUE_FLAGS
+
+# argparse dest -> default for every config option
+_CONFIG_DEFAULTS = {
+    flag[2:].replace("-", "_"): None if flag in _CONFIG_VALUE_FLAGS else False
+    for flag in _CONFIG_DEFAULT_FLAGS
+}
+
+
+# Options of the full parser that take a value, and those whose value is
+# optional (nargs="?"). Both only consume a next token not starting with "-".
+_VALUE_OPTIONS = _CONFIG_VALUE_FLAGS | frozenset({
+    "--path", "--project", "--agent", "-a", "--todo-id", "--api-url", "--timeout",
+    "--resume", "-r", "--edge",
+})
+
+
+def _scan_argv(argv: List[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (name, value) for each argv item the way argparse splits them.
+
+    Options give their name and inline "=value" or following value (None if
+    absent); positionals give ("", token). A "--" is yielded as ("--", None)
+    and ends the scan, since everything after it is positional.
+    """
+    i, n = 0, len(argv)
+    while i < n:
+        token = argv[i]
+        i += 1
+        if token == "--":
+            yield token, None
+            return
+        if not token.startswith("-") or token == "-":
+            yield "", token
+            continue
+        name, sep, value = token.partition("=")
+        if not sep:
+            value = None
+            if name in _VALUE_OPTIONS and i < n and not argv[i].startswith("-"):
+                value = argv[i]
+                i += 1
+        yield name, value
+
+
+def parse_config_argv(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse an argv made only of config options, without loading argparse.
+
+    Returns None for anything else (no config command, other options or
+    positionals, abbreviations, "--", missing or empty values) so the caller
+    can fall back to argparse and its error messages.
+    """
+    values = dict(_CONFIG_DEFAULTS)
+    found = False
+    for name, value in _scan_argv(argv):
+        if name in _CONFIG_VALUE_FLAGS:
+            if not value:
+                return None
+        elif name in CONFIG_FLAGS and value is None:
+            value = True
+        else:
+            return None
+        found = found or name in CONFIG_FLAGS
+        values[name[2:].replace("-", "_")] = value
+    return SimpleNamespace(**values) if found else None
+
+
+def _add_config_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Register --config-path and the configuration argument group."""
+    parser.add_argument("--config-path", metavar="PATH", help="Custom config file path")
+
+    config_group = parser.add_argument_group("configuration")
+    config_group.add_argument(
+        "--set-defaults",
+        action="store_true",
+        help="Interactive configuration of default settings",
+    )
+    config_group.add_argument(
+        "--set-default-project", metavar="PROJECT_ID", help="Set default project ID"
+    )
+    config_group.add_argument(
+        "--set-default-agent", metavar="AGENT_NAME", help="Set default agent name"
+    )
+    config_group.add_argument(
+        "--set-default-api-url", metavar="API_URL", help="Set default API URL"
+    )
+    config_group.add_argument(
+        "--set-default-api-key", metavar="API_KEY", help="Set default API key"
+    )
+    config_group.add_argument(
+        "--show-config",
+        action="store_true",
+        help="Show current configuration (includes path)",
+    )
+    config_group.add_argument(
+        "--reset-config",
+        action="store_true",
+        help="Reset configuration file at current path",
+    )
+
+
+def build_parser(include_config: bool = True) -> "argparse.ArgumentParser":
+    """Build the CLI argument parser.
+
+    Without include_config the configuration options are left out (only
+    their defaults are set), for runs whose argv cannot refer to them.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Create TODOs and stream results",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -85,7 +215,9 @@ Examples:
         help="Watch timeout in seconds (default: 300)",
     )
     parser.add_argument(
-        "--safe", action="store_true", help="Validate API key and fetch lists upfront"
+        "--safe",
+        action="store_true",
+        help="Validate API key and always fetch project/agent lists instead of using saved defaults",
     )
     parser.add_argument(
         "-d", "--debug", action="store_true", help="Enable debug output"
@@ -104,44 +236,38 @@ Examples:
         dest="skip_permissions",
         help="Auto-approve all blocks without prompting (for CI/benchmarks)",
     )
-    parser.add_argument("--config-path", metavar="PATH", help="Custom config file path")
-
-    # Config management
-    config_group = parser.add_argument_group("configuration")
-    config_group.add_argument(
-        "--set-defaults",
-        action="store_true",
-        help="Interactive configuration of default settings",
-    )
-    config_group.add_argument(
-        "--set-default-project", metavar="PROJECT_ID", help="Set default project ID"
-    )
-    config_group.add_argument(
-        "--set-default-agent", metavar="AGENT_NAME", help="Set default agent name"
-    )
-    config_group.add_argument(
-        "--set-default-api-url", metavar="API_URL", help="Set default API URL"
-    )
-    config_group.add_argument(
-        "--set-default-api-key", metavar="API_KEY", help="Set default API key"
-    )
-    config_group.add_argument(
-        "--show-config",
-        action="store_true",
-        help="Show current configuration (includes path)",
-    )
-    config_group.add_argument(
-        "--reset-config",
-        action="store_true",
-        help="Reset configuration file at current path",
-    )
+    if include_config:
+        _add_config_arguments(parser)
+    else:
+        parser.set_defaults(**_CONFIG_DEFAULTS)
 
     return parser
 
 
+def mentions_config_option(argv: List[str]) -> bool:
+    """True if argv may name a config option, including argparse's
+    unambiguous-prefix abbreviations, or asks for --help.
+
+    Uses the same scan as parse_config_argv, so option values and anything
+    after "--" never count.
+    """
+    for name, _ in _scan_argv(argv):
+        if name in ("-h", "--help"):
+            return True
+        if name.startswith("--") and len(name) > 2 and any(
+            flag.startswith(name) for flag in _CONFIG_DEFAULT_FLAGS
+        ):
+            return True
+    return False
+
+
 def handle_config_commands(cfg, args) -> bool:
     """Handle config-related commands. Returns True if a command was handled."""
     if args.show_config:
+        # stdlib json on purpose: importing orjson costs more than it saves
+        # for one small dict (it pulls in json and uuid itself)
+        import json
+
         print(f"Config file: {_format_path_with_tilde(str(cfg.config_path))}")
         print(json.dumps(cfg.data, indent=2))
         return True
@@ -156,8 +282,9 @@ def handle_config_commands(cfg, args) -> bool:
 
     if args.set_defaults:
         from .config_ui import interactive_set_defaults
+        from .event_loop import run
 
-        asyncio.run(interactive_set_defaults(cfg))
+        run(interactive_set_defaults(cfg))
         return True
 
     if (
@@ -166,18 +293,20 @@ def handle_config_commands(cfg, args) -> bool:
         or args.set_default_api_url
         or args.set_default_api_key
     ):
-        if args.set_default_project:
-            cfg.set_default_project(args.set_default_project)
-            print(f"Default project set to: {args.set_default_project}")
-        if args.set_default_agent:
-            cfg.set_default_agent(args.set_default_agent)
-            print(f"Default agent set to: {args.set_default_agent}")
-        if args.set_default_api_url:
-            cfg.set_default_api_url(args.set_default_api_url)
-            print(f"Default API URL set to: {args.set_default_api_url}")
-        if args.set_default_api_key:
-            cfg.set_default_api_key(args.set_default_api_key)
-            print(f"Default API key set")
+        # One config write for all the values given
+        with cfg.batch():
+            if args.set_default_project:
+                cfg.set_default_project(args.set_default_project)
+                print(f"Default project set to: {args.set_default_project}")
+            if args.set_default_agent:
+                cfg.set_default_agent(args.set_default_agent)
+                print(f"Default agent set to: {args.set_default_agent}")
+            if args.set_default_api_url:
+                cfg.set_default_api_url(args.set_default_api_url)
+                print(f"Default API URL set to: {args.set_default_api_url}")
+            if args.set_default_api_key:
+                cfg.set_default_api_key(args.set_default_api_key)
+                print(f"Default API key set")
         return True
 
     return False
@@ -1,25 +1,36 @@
-import json
 import os
-import platform
+import sys
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 import stat
-import base64
 
 
 def get_default_config_dir() -> Path:
     """Get the appropriate config directory for the current platform"""
-    system = platform.system()
-    if system == "Windows":
+    if sys.platform == "win32":
         base = os.environ.get("APPDATA", os.path.expanduser("~\\AppData\\Roaming"))
         return Path(base) / "todoai-cli"
-    elif system == "Darwin":
+    elif sys.platform == "darwin":
         return Path.home() / "Library" / "Application Support" / "todoai-cli"
     else:
         xdg_config = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
         return Path(xdg_config) / "todoai-cli"
 
 
+def get_default_cache_dir() -> Path:
+    """Get the appropriate cache directory for the current platform"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~\\AppData\\Local"))
+        return Path(base) / "todoai-cli" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "todoai-cli"
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        return Path(xdg_cache) / "todoai-cli"
+
+
 def resolve_config_path(path_arg: Optional[str]) -> Path:
     """Resolve user-provided config path or use default"""
     if path_arg:
@@ -34,6 +45,8 @@ def _simple_obfuscate(data: str) -> str:
     """Simple obfuscation for API keys (not encryption, just encoding)"""
     if not data:
         return data
+    import base64
+
     return base64.b64encode(data.encode('utf-8')).decode('utf-8')
 
 
@@ -41,6 +54,8 @@ def _simple_deobfuscate(data: str) -> str:
     """Reverse simple obfuscation"""
     if not data:
         return data
+    import base64
+
     try:
         return base64.b64decode(data.encode('utf-8')).decode('utf-8')
     except Exception:
@@ -50,7 +65,13 @@ def _simple_deobfuscate(data: str) -> str:
 class TODOCLIConfig:
     def __init__(self, path_arg: Optional[str] = None):
         self.config_path: Path = resolve_config_path(path_arg)
-        self.data = self.load_config()
+        self._batch_depth = 0
+        self._dirty = False
+
+    @cached_property
+    def data(self) -> dict:
+        """Config data, loaded on first access (--reset-config never reads it)."""
+        return self.load_config()
     
     @property
     def config_dir(self) -> Path:
@@ -69,6 +90,8 @@ class TODOCLIConfig:
     def load_config(self) -> dict:
         """Load configuration from file"""
         if self.config_path.exists():
+            import json
+
             try:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -84,6 +107,8 @@ class TODOCLIConfig:
     
     def save_config(self):
         """Persist configuration to file with secure permissions"""
+        import json
+
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
@@ -98,6 +123,29 @@ class TODOCLIConfig:
         except OSError:
             pass
     
+    @contextmanager
+    def batch(self):
+        """Defer setter writes until the outermost batch exits (or flush())."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        """Write pending changes made inside a batch."""
+        if self._dirty:
+            self._dirty = False
+            self.save_config()
+
+    def _changed(self):
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_config()
+
     def set_default_project(self, project_id: str, project_name: str = None):
         self.data["default_project_id"] = project_id
         recent = self.data.get("recent_projects", [])
@@ -105,7 +153,7 @@ class TODOCLIConfig:
         recent = [p for p in recent if p["id"] != project_id]
         recent.insert(0, entry)
         self.data["recent_projects"] = recent[:10]
-        self.save_config()
+        self._changed()
     
     def set_default_agent(self, agent_name: str, agent_settings: dict = None):
         from datetime import datetime, timezone
@@ -116,12 +164,16 @@ class TODOCLIConfig:
         if agent_name not in recent:
             recent.insert(0, agent_name)
             self.data["recent_agents"] = recent[:10]
-        self.save_config()
+        self._changed()
     
     def set_default_api_url(self, api_url: str):
         self.data["default_api_url"] = api_url
-        self.save_config()
+        self._changed()
     
     def set_default_api_key(self, api_key: str):
         self.data["default_api_key"] = api_key
-        self.save_config()
\ No newline at end of file
+        self._changed()
+
+    def set_last_todo_id(self, todo_id: str):
+        self.data["last_todo_id"] = todo_id
+        self._changed()
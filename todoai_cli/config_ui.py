@@ -28,13 +28,18 @@ async def interactive_set_defaults(config):
     ]
 
     while True:
-        print("\nConfigure Default Settings", file=sys.stderr)
-        print("=" * 40, file=sys.stderr)
-        print(
-            "Which default config values would you like to change?", file=sys.stderr
-        )
-        print("", file=sys.stderr)
-
+        # Render the whole menu and write it at once
+        lines = [
+            "\nConfigure Default Settings",
+            "=" * 40,
+            "Which default config values would you like to change?",
+            "",
+        ]
+        # Reversed so the first entry wins for duplicate ids, as before
+        recent_names = {
+            r.get("id"): r.get("name")
+            for r in reversed(config.data.get("recent_projects", []))
+        }
         for i, option in enumerate(config_options, 1):
             current = config.data.get(option["key"])
             if option["type"] == "password" and current:
@@ -43,18 +48,13 @@ async def interactive_set_defaults(config):
                 else:
                     current = "***set***"
             elif option["type"] == "project" and current:
-                project_name = None
-                for recent in config.data.get("recent_projects", []):
-                    if recent.get("id") == current:
-                        project_name = recent.get("name")
-                        break
-                current = project_name or current
+                current = recent_names.get(current) or current
             elif not current:
                 current = "not set"
-            print(f" [{i}] {option['name']}: {current}", file=sys.stderr)
+            lines.append(f" [{i}] {option['name']}: {current}")
 
-        print("\n [0] Exit configuration", file=sys.stderr)
-        print("", file=sys.stderr)
+        lines += ["\n [0] Exit configuration", "", ""]
+        sys.stderr.write("\n".join(lines))
 
         try:
             choice = _get_terminal_input("Select option to configure: ").strip()
@@ -102,16 +102,16 @@ async def _configure_project(config, edge):
 
         projects = await edge.list_projects()
 
-        print("\nAvailable Projects:", file=sys.stderr)
+        lines = ["\nAvailable Projects:"]
         for i, project in enumerate(projects, 1):
             project_name = _get_display_name(project)
             project_id = _get_item_id(project)
-            print(f" [{i}] {project_name}", file=sys.stderr)
+            lines.append(f" [{i}] {project_name}")
             if project_id != project_name:
-                print(f"     {project_id}", file=sys.stderr)
+                lines.append(f"     {project_id}")
 
-        print(" [0] Enter custom project ID", file=sys.stderr)
-        print("", file=sys.stderr)
+        lines += [" [0] Enter custom project ID", "", ""]
+        sys.stderr.write("\n".join(lines))
 
         while True:
             choice = _get_terminal_input("Select project: ").strip()
@@ -155,13 +155,12 @@ async def _configure_agent(config, edge):
 
         agents = await edge.list_agent_settings()
 
-        print("\nAvailable Agents:", file=sys.stderr)
-        for i, agent in enumerate(agents, 1):
-            agent_name = _get_display_name(agent)
-            print(f" [{i}] {agent_name}", file=sys.stderr)
-
-        print(" [0] Enter custom agent name", file=sys.stderr)
-        print("", file=sys.stderr)
+        lines = ["\nAvailable Agents:"]
+        lines.extend(
+            f" [{i}] {_get_display_name(agent)}" for i, agent in enumerate(agents, 1)
+        )
+        lines += [" [0] Enter custom agent name", "", ""]
+        sys.stderr.write("\n".join(lines))
 
         while True:
             choice = _get_terminal_input("Select agent: ").strip()
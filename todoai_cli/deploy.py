@@ -38,19 +38,12 @@ def bump_version(current_version, bump_type="patch"):
     return f"{major}.{minor}.{patch}"
 
 def update_version_files(new_version):
-    """Update version in __init__.py and setup.py"""
-    # Update __init__.py
+    """Update version in __init__.py (pyproject.toml reads it from there)"""
     init_file = Path(__file__).parent / "__init__.py"
     content = init_file.read_text()
     content = re.sub(r'__version__ = "[^"]+"', f'__version__ = "{new_version}"', content)
     init_file.write_text(content)
     
-    # Update setup.py
-    setup_file = Path(__file__).parent.parent / "setup.py"
-    content = setup_file.read_text()
-    content = re.sub(r'version="[^"]+"', f'version="{new_version}"', content)
-    setup_file.write_text(content)
-    
     print(f"Updated version to {new_version}")
 
 def run_command(cmd, check=True):
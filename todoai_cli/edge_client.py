@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from typing import Optional
 
@@ -5,6 +6,24 @@ from todoforai_edge.edge import TODOforAIEdge
 from todoforai_edge.config import Config
 
 
+class EmbeddedEdge(TODOforAIEdge):
+    """Edge runtime that sets `edge_ready` as soon as it is assigned an edge_id."""
+
+    def __init__(self, cfg: Config, edge_ready: asyncio.Event):
+        self.edge_ready = edge_ready
+        super().__init__(cfg)
+
+    @property
+    def edge_id(self) -> Optional[str]:
+        return self.__dict__.get("edge_id")
+
+    @edge_id.setter
+    def edge_id(self, value: Optional[str]):
+        self.__dict__["edge_id"] = value
+        if value:
+            self.edge_ready.set()
+
+
 async def init_edge(cli_api_url: Optional[str], saved_default_api_url: Optional[str], saved_default_api_key: Optional[str], skip_validation: bool = True) -> TODOforAIEdge:
     """
     Build the Edge client using URL priority:
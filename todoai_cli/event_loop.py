@@ -0,0 +1,15 @@
+"""Event loop runner that uses uvloop when it is installed."""
+
+
+def run(coro):
+    """Run coro to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    # Run outside the except block so errors aren't chained to the ImportError.
+    if uvloop is None:
+        import asyncio
+
+        return asyncio.run(coro)
+    return uvloop.run(coro)
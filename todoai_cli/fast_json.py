@@ -0,0 +1,41 @@
+"""JSON encoding that uses orjson when it is installed."""
+
+_orjson = None  # orjson module once loaded, False if it isn't installed
+
+
+def _get_orjson():
+    """Import orjson on first use so --help and config commands don't pay for it."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = False
+        _orjson = orjson
+    return _orjson
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (2-space indented if indent is set)."""
+    orjson = _get_orjson()
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            pass  # Non-str keys, ints over 64 bits etc. - let stdlib json handle them
+    import json
+
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumpb(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, skipping orjson's str round-trip."""
+    orjson = _get_orjson()
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    import json
+
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
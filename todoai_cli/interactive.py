@@ -5,7 +5,19 @@ import sys
 
 from prompt_toolkit.patch_stdout import patch_stdout
 
+from .message_display import SEPARATOR
 from .prompt_input import create_session, get_interactive_input
+from .watch import _sigint_scope
+
+
+_EXIT_CMDS = frozenset({"/exit", "/quit", "/q", "q", "exit"})
+_HELP_CMDS = frozenset({"/help", "?"})
+_HELP_TEXT = (
+    "  /exit, /quit, /q  - quit\n"
+    "  /help, ?          - show this help\n"
+    "  Tab               - show completions\n"
+    "  Arrow Right       - accept suggestion\n"
+)
 
 
 async def _cancel_task(task):
@@ -32,7 +44,8 @@ async def interactive_loop(watch_fn, send_fn):
     """
     session = create_session()
     watch_task = input_task = activity_task = None
-    with patch_stdout(raw=True):
+    # One SIGINT scope for the session; each watch turn only swaps its callback
+    with patch_stdout(raw=True), _sigint_scope():
         while True:
             try:
                 activity_event = asyncio.Event()
@@ -67,16 +80,14 @@ async def interactive_loop(watch_fn, send_fn):
 
                 if not follow_up:
                     continue
-                if follow_up in ("/help", "?"):
-                    print("  /exit, /quit, /q  - quit", file=sys.stderr)
-                    print("  /help, ?          - show this help", file=sys.stderr)
-                    print("  Tab               - show completions", file=sys.stderr)
-                    print("  Arrow Right       - accept suggestion", file=sys.stderr)
+                if follow_up in _HELP_CMDS:
+                    sys.stderr.write(_HELP_TEXT)
+                    sys.stderr.flush()
                     continue
-                if follow_up in ("/exit", "/quit", "/q", "q", "exit"):
+                if follow_up in _EXIT_CMDS:
                     break
 
-                print("─" * 40, file=sys.stderr)
+                print(SEPARATOR, file=sys.stderr)
                 await send_fn(follow_up)
                 await watch_fn(interrupt_on_cancel=True, suppress_cancel_notice=False)
             except (KeyboardInterrupt, EOFError):
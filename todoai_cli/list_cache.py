@@ -0,0 +1,74 @@
+"""On-disk cache of the project and agent lists between runs."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config_store import get_default_cache_dir
+
+LIST_CACHE_TTL = 300  # Seconds a cached list stays usable
+
+
+class ListCache:
+    """JSON {name: [fetched_at, items]} per API URL + key.
+
+    read=False turns lookups off while still storing fresh results, which is
+    what --safe wants: always hit the network, but leave a warm cache behind.
+    """
+
+    def __init__(self, api_url: str, api_key: str, read: bool = True,
+                 ttl: float = LIST_CACHE_TTL, cache_dir: Optional[Path] = None):
+        digest = hashlib.sha1(f"{api_url}\0{api_key}".encode("utf-8")).hexdigest()[:16]
+        self.path = (cache_dir or get_default_cache_dir()) / f"lists-{digest}.json"
+        self.read = read
+        self.ttl = ttl
+        self._entries: Optional[dict] = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, "rb") as f:
+                    entries = json.load(f)
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Write atomically with owner-only permissions (agent settings are private)."""
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def get(self, name: str) -> Optional[list]:
+        """Return the cached list if it is younger than the TTL, else None."""
+        if not self.read:
+            return None
+        entry = self._load().get(name)
+        try:
+            fetched_at, items = entry
+            if time.time() - fetched_at > self.ttl or not isinstance(items, list):
+                return None
+        except (TypeError, ValueError):  # Missing or malformed entry
+            return None
+        return items
+
+    def put(self, name: str, items: list):
+        self._load()[name] = [time.time(), items]
+        self._save()
+
+    def invalidate(self, name: str):
+        if self._load().pop(name, None) is not None:
+            self._save()
@@ -11,9 +11,13 @@ RED = "\033[31m"
 DIM = "\033[90m"
 CYAN = "\033[36m"
 ORANGE = "\033[38;5;208m"
+BRAND_ORANGE = "\033[38;2;249;110;46m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+# Rule printed between turns of a conversation
+SEPARATOR = "─" * 40
+
 
 # Block renderers - easy to extend without modifying existing code
 BlockRenderer = Callable[[Dict[str, Any]], Optional[str]]
@@ -110,7 +114,7 @@ class MessageDisplay:
             return
 
         print(f"\nPrevious messages ({len(messages)}):", file=file)
-        print("─" * 40, file=file)
+        print(SEPARATOR, file=file)
 
         for msg in messages:
             role = msg.get("role", "unknown")
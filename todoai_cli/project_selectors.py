@@ -1,10 +1,11 @@
 import asyncio
+import atexit
 import os
 import sys
-from typing import Callable, List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, List, Dict, Tuple, Optional
 
-from todoforai_edge.utils import findBy
-from todoforai_edge.types import ProjectListItem, AgentSettings
+if TYPE_CHECKING:
+    from todoforai_edge.types import ProjectListItem, AgentSettings
 
 
 def _get_display_name(item: Dict) -> str:
@@ -116,6 +117,18 @@ def _get_single_char_input(prompt: str) -> str:
         raise
 
 
+_tty_fd: Optional[int] = None
+
+
+def _get_tty_fd() -> int:
+    """Open /dev/tty once and reuse the descriptor for later prompts."""
+    global _tty_fd
+    if _tty_fd is None:
+        _tty_fd = os.open("/dev/tty", os.O_RDWR)
+        atexit.register(os.close, _tty_fd)
+    return _tty_fd
+
+
 async def _async_single_char_input(prompt: str) -> str:
     """Fully async single-char input using add_reader. Cancellable via task.cancel()."""
     try:
@@ -124,7 +137,7 @@ async def _async_single_char_input(prompt: str) -> str:
 
         loop = asyncio.get_running_loop()
         future = loop.create_future()
-        tty_fd = os.open("/dev/tty", os.O_RDWR)
+        tty_fd = _get_tty_fd()
         old_settings = termios.tcgetattr(tty_fd)
         tty.setcbreak(tty_fd)
         termios.tcflush(tty_fd, termios.TCIFLUSH)
@@ -149,13 +162,12 @@ async def _async_single_char_input(prompt: str) -> str:
         finally:
             loop.remove_reader(tty_fd)
             termios.tcsetattr(tty_fd, termios.TCSADRAIN, old_settings)
-            os.close(tty_fd)
     except (ImportError, OSError):
         # Fallback: use to_thread with sync version
         return await asyncio.to_thread(_get_single_char_input, prompt)
 
 
-def select_project(projects: List[ProjectListItem], default_project_id: Optional[str], set_default: Callable[[str, str], None]) -> Tuple[str, str]:
+def select_project(projects: List["ProjectListItem"], default_project_id: Optional[str], set_default: Callable[[str, str], None]) -> Tuple[str, str]:
     """Interactive project selection with default and recent support"""
     if not projects:
         print("Error: No projects available", file=sys.stderr)
@@ -172,7 +184,7 @@ def select_project(projects: List[ProjectListItem], default_project_id: Optional
     
     # Check if default project exists
     if default_project_id:
-        project = findBy(projects, lambda p: _get_item_id(p) == default_project_id)
+        project = next((p for p in projects if _get_item_id(p) == default_project_id), None)
         if project:
             project_name = _get_display_name(project)
             print(f"Using default project: {project_name} ({default_project_id})", file=sys.stderr)
@@ -221,7 +233,7 @@ def select_project(projects: List[ProjectListItem], default_project_id: Optional
             sys.exit(1)
 
 
-def select_agent(agents: List[AgentSettings], default_agent_name: Optional[str], set_default: Callable[[str, dict], None]) -> AgentSettings:
+def select_agent(agents: List["AgentSettings"], default_agent_name: Optional[str], set_default: Callable[[str, dict], None]) -> "AgentSettings":
     """Interactive agent selection with default support (partial name match)"""
     if not agents:
         print("Error: No agents available", file=sys.stderr)
@@ -237,7 +249,8 @@ def select_agent(agents: List[AgentSettings], default_agent_name: Optional[str],
     
     # Check if default agent exists
     if default_agent_name:
-        agent = findBy(agents, lambda a: default_agent_name.lower() in _get_display_name(a).lower())
+        needle = default_agent_name.lower()
+        agent = next((a for a in agents if needle in _get_display_name(a).lower()), None)
         if agent:
             agent_name = _get_display_name(agent)
             print(f"Using default agent: {agent_name}", file=sys.stderr)
@@ -1,52 +1,92 @@
 """Watch todo execution and handle block approvals."""
 
 import asyncio
-import json
+import os
 import signal
 import sys
+from contextlib import contextmanager
 
-from todoforai_edge.frontend_ws import TodoStreamError
-
+from .fast_json import dumps
 from .message_display import YELLOW, GREEN, RED, DIM, CYAN, RESET
 from .project_selectors import _async_single_char_input
 
 
+_IGNORE_MSG_TYPES = frozenset({
+    "todo:msg_start",
+    "todo:msg_done",
+    "todo:msg_stop_sequence",
+    "todo:msg_meta_ai",
+    "todo:new_message_created",
+    "block:end",
+    "block:start_shell",
+    "block:start_createfile",
+    "block:start_modifyfile",
+    "block:start_mcp",
+    "block:start_catfile",
+    "block:sh_msg_start",
+    "block:sh_done",
+})
+
+# Routing fields that are noise when showing a block's arguments
+_UNIVERSAL_SKIP_KEYS = frozenset({
+    "userId", "messageId", "todoId", "blockId", "block_type", "edge_id", "timeout",
+})
+
+
+# Block classification rules in precedence order: (type substring, kind).
+# _CLASSIFY_INNER maps payload block_type names to (rule index, kind).
+_CLASSIFY_BTYPE = (
+    ("createfile", "file"),
+    ("modifyfile", "file"),
+    ("catfile", "read"),
+    ("mcp", "mcp"),
+    ("shell", "shell"),
+)
+_CLASSIFY_INNER = {
+    "create": (0, "file"),
+    "createfile": (0, "file"),
+    "modify": (1, "file"),
+    "modifyfile": (1, "file"),
+    "update": (1, "file"),
+    "catfile": (2, "read"),
+    "read": (2, "read"),
+    "readfile": (2, "read"),
+    "mcp": (3, "mcp"),
+    "shell": (4, "shell"),
+    "bash": (4, "shell"),
+}
+
+
 def _classify_block(block_info):
     """Classify block type from block_info."""
     btype = block_info.get("type", "")
     bp = block_info.get("payload", {})
-    inner = bp.get("block_type", "").lower()
-    if "createfile" in btype or inner in ("create", "createfile"):
-        return "file"
-    if "modifyfile" in btype or inner in ("modify", "modifyfile", "update"):
-        return "file"
-    if "catfile" in btype or inner in ("catfile", "read", "readfile"):
-        return "read"
-    if "mcp" in btype or inner == "mcp":
-        return "mcp"
-    if "shell" in btype or inner in ("shell", "bash") or bp.get("cmd"):
+    hit = _CLASSIFY_INNER.get(bp.get("block_type", "").lower())
+    # Only rules ranked above the block_type match can still take precedence
+    for substr, kind in _CLASSIFY_BTYPE[: hit[0] if hit else None]:
+        if substr in btype:
+            return kind
+    if hit:
+        return hit[1]
+    if bp.get("cmd"):
         return "shell"
     return "unknown"
 
 
+_BLOCK_LABELS = {"file": "File", "read": "Read File", "mcp": "MCP", "shell": "Shell"}
+# Payload keys shown as the block's main text; the rest are listed as key=value
+_BLOCK_MAIN_KEYS = ("path", "filePath", "content", "cmd", "name")
+_BLOCK_HIDDEN_KEYS = _UNIVERSAL_SKIP_KEYS | frozenset(_BLOCK_MAIN_KEYS)
+
+
 def _block_display(block_info):
     """Return (type_label, display_text) for a block."""
-    labels = {"file": "File", "read": "Read File", "mcp": "MCP", "shell": "Shell"}
     block_payload = block_info.get("payload", {})
     block_kind = _classify_block(block_info)
     inner = block_payload.get("block_type", "")
-    type_label = labels.get(block_kind, inner or "Tool")
-    skip_keys = {"userId", "messageId", "todoId", "blockId", "block_type", "edge_id", "timeout"}
-    known_keys = {"path", "filePath", "content", "cmd", "name"}
-    display = (
-        block_payload.get("path")
-        or block_payload.get("filePath")
-        or block_payload.get("content")
-        or block_payload.get("cmd")
-        or block_payload.get("name")
-        or ""
-    )
-    rest = {k: v for k, v in block_payload.items() if k not in skip_keys | known_keys and v}
+    type_label = _BLOCK_LABELS.get(block_kind, inner or "Tool")
+    display = next((v for v in map(block_payload.get, _BLOCK_MAIN_KEYS) if v), "")
+    rest = {k: v for k, v in block_payload.items() if v and k not in _BLOCK_HIDDEN_KEYS}
     if rest:
         extra = " ".join(f"{k}={v}" for k, v in rest.items())
         display = f"{display} ({extra})" if display else extra
@@ -68,7 +108,111 @@ async def _approve_block(ws, block_id, message_id, todo_id):
             "decision": "allow_once",
         },
     }
-    await ws.ws.send(json.dumps(msg))
+    await ws.ws.send(dumps(msg))
+
+
+_sigint_callbacks = []  # on_interrupt of each active scope, innermost last
+_sigint_saved = None  # Handler to restore when the outermost scope exits
+_sigint_depth = 0
+
+
+def _dispatch_sigint(signum, frame):
+    if _sigint_callbacks:
+        _sigint_callbacks[-1]()
+    elif callable(_sigint_saved):
+        _sigint_saved(signum, frame)
+    elif _sigint_saved is not signal.SIG_IGN:
+        signal.default_int_handler(signum, frame)
+
+
+@contextmanager
+def _sigint_scope(on_interrupt=None):
+    """Route SIGINT to on_interrupt (if given) while the block runs.
+
+    Only the outermost scope swaps the process signal handler, so wrapping a
+    loop of watch_todo calls in one scope installs it once per session
+    instead of once per turn. Outside any on_interrupt, Ctrl+C behaves as
+    it did before the scope was entered. An ignored SIGINT (nohup, or a
+    parent that ignores it) is left ignored.
+    """
+    global _sigint_saved, _sigint_depth
+    if _sigint_depth == 0:
+        _sigint_saved = signal.getsignal(signal.SIGINT)
+        if _sigint_saved is not signal.SIG_IGN:
+            signal.signal(signal.SIGINT, _dispatch_sigint)
+    elif (
+        _sigint_saved is not signal.SIG_IGN
+        and signal.getsignal(signal.SIGINT) is not _dispatch_sigint
+    ):
+        # Someone else took over SIGINT in between (e.g. prompt_toolkit's
+        # prompt, which restores the default handler when it finishes)
+        signal.signal(signal.SIGINT, _dispatch_sigint)
+    _sigint_depth += 1
+    if on_interrupt:
+        _sigint_callbacks.append(on_interrupt)
+    try:
+        yield
+    finally:
+        if on_interrupt:
+            _sigint_callbacks.remove(on_interrupt)
+        _sigint_depth -= 1
+        if _sigint_depth == 0 and _sigint_saved is not signal.SIG_IGN:
+            # None means a handler not set from Python; the default is closest
+            signal.signal(signal.SIGINT, _sigint_saved or signal.SIG_DFL)
+
+
+# Text-mode streams only translate "\n" on platforms with another line separator
+_RAW_WRITES = os.linesep == "\n"
+
+
+class _OutputBuffer:
+    """Coalesce streamed output into few writes, flushed on a short timer.
+
+    Writes to stdout and stderr keep their relative order: switching streams
+    flushes whatever is pending for the other one first.
+    """
+
+    FLUSH_DELAY = 0.01
+    MAX_PENDING = 4096
+
+    def __init__(self):
+        self._stream = None
+        self._parts = []
+        self._size = 0
+        self._handle = None
+
+    def write(self, stream, text):
+        if stream is not self._stream:
+            self.flush()
+            self._stream = stream
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.MAX_PENDING:
+            self.flush()
+        elif self._handle is None:
+            loop = asyncio.get_running_loop()
+            self._handle = loop.call_later(self.FLUSH_DELAY, self.flush)
+
+    def flush(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._parts:
+            stream = self._stream
+            data = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            # Write encoded bytes straight to the binary layer when there is
+            # one (not under patch_stdout, and not where text mode would
+            # translate newlines), skipping TextIOWrapper's encoder and lock.
+            raw = getattr(stream, "buffer", None) if _RAW_WRITES else None
+            if raw is not None:
+                stream.flush()  # Keep order with text written via print()
+                raw.write(data.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+                raw.flush()
+            else:
+                stream.write(data)
+                stream.flush()
 
 
 async def watch_todo(
@@ -89,55 +233,42 @@ async def watch_todo(
     activity_event: optional asyncio.Event set whenever visible output is produced.
     The interactive loop uses this to cancel the prompt before output lands.
     """
-    ignore = {
-        "todo:msg_start",
-        "todo:msg_done",
-        "todo:msg_stop_sequence",
-        "todo:msg_meta_ai",
-        "todo:new_message_created",
-        "block:end",
-        "block:start_shell",
-        "block:start_createfile",
-        "block:start_modifyfile",
-        "block:start_mcp",
-        "block:start_catfile",
-        "block:sh_msg_start",
-        "block:sh_done",
-    }
+    from todoforai_edge.frontend_ws import TodoStreamError
 
     def _signal_activity():
         if activity_event and not activity_event.is_set():
             activity_event.set()
 
+    out = _OutputBuffer()
+
+    def _err(text):
+        out.write(sys.stderr, text + "\n")
+
     def on_message(msg_type, payload):
         if msg_type == "block:message":
-            sys.stdout.write(payload.get("content", ""))
-            sys.stdout.flush()
+            out.write(sys.stdout, payload.get("content", ""))
             _signal_activity()
         elif msg_type == "BLOCK_UPDATE":
             updates = payload.get("updates", {})
             status = updates.get("status")
             result = updates.get("result")
             if result:
-                print(f"\n{DIM}--- Block Result ---\n{result}{RESET}", file=sys.stderr)
+                _err(f"\n{DIM}--- Block Result ---\n{result}{RESET}")
                 _signal_activity()
             elif status == "AWAITING_APPROVAL":
                 block_id = payload.get("blockId", "")
                 suffix = f" ({block_id})" if block_id else ""
-                print(
-                    f"\n{YELLOW}⚠ Awaiting approval{suffix}{RESET}", file=sys.stderr
-                )
+                _err(f"\n{YELLOW}⚠ Awaiting approval{suffix}{RESET}")
                 _signal_activity()
             elif status and status not in ("COMPLETED", "RUNNING"):
-                print(f"\n[block:update] status={status}", file=sys.stderr)
+                _err(f"\n[block:update] status={status}")
                 _signal_activity()
         elif msg_type == "block:start_universal":
-            skip = {"userId", "messageId", "todoId", "blockId", "block_type", "edge_id", "timeout"}
             block_type = payload.get("block_type", "UNIVERSAL")
-            info = {k: v for k, v in payload.items() if k not in skip}
-            parts = [f"{k}={v}" for k, v in info.items()]
-            extra = f" {' '.join(parts)}" if parts else ""
-            print(f"\n{YELLOW}*{RESET} {YELLOW}{block_type}{RESET}{extra}", file=sys.stderr)
+            extra = "".join(
+                f" {k}={v}" for k, v in payload.items() if k not in _UNIVERSAL_SKIP_KEYS
+            )
+            _err(f"\n{YELLOW}*{RESET} {YELLOW}{block_type}{RESET}{extra}")
             _signal_activity()
         elif msg_type == "block:sh_msg_result":
             content = payload.get("content", "")
@@ -145,49 +276,31 @@ async def watch_todo(
                 lines = content.strip().splitlines()
                 preview = "\n".join(f"  {DIM}│{RESET} {l}" for l in lines[:4])
                 extra = f"\n  {DIM}│ +{len(lines) - 4} lines{RESET}" if len(lines) > 4 else ""
-                print(f"{preview}{extra}", file=sys.stderr)
+                _err(f"{preview}{extra}")
                 _signal_activity()
         elif msg_type == "todo:status":
             status = payload.get("status", "")
-            print(f"\n{DIM}[todo:status] {status}{RESET}", file=sys.stderr)
+            _err(f"\n{DIM}[todo:status] {status}{RESET}")
             _signal_activity()
-        elif msg_type not in ignore:
-            print(f"\n[{msg_type}]", file=sys.stderr)
+        elif msg_type not in _IGNORE_MSG_TYPES:
+            _err(f"\n[{msg_type}]")
             _signal_activity()
 
-    # Get edge config for approvals
-    edge_id = None
-    root_path = ""
-    if embedded_edge and embedded_edge.edge_id:
-        edge_id = embedded_edge.edge_id
-        wp = embedded_edge.edge_config.config.get("workspacepaths", [])
-        root_path = wp[0] if wp else ""
-    elif agent_settings:
-        edges_mcp_configs = agent_settings.get("edgesMcpConfigs", {})
-        edge_id = next(iter(edges_mcp_configs.keys()), None)
-        if edge_id:
-            edge_config = edges_mcp_configs.get(edge_id, {})
-            todoai_config = edge_config.get("todoai_edge") or edge_config.get(
-                "todoai", {}
-            )
-            workspace_paths = todoai_config.get("workspacePaths", [])
-            root_path = workspace_paths[0] if workspace_paths else ""
-
     approve_all = auto_approve
 
     async def handle_approval(ws, blocks):
         nonlocal approve_all
+        out.flush()
 
         if approve_all:
+            # Approve first so the backend isn't kept waiting on formatting
             for bi in blocks:
-                tl, disp = _block_display(bi)
-                print(
-                    f"\n{YELLOW}⚠ Auto-approving [{tl}]{RESET} {disp}",
-                    file=sys.stderr,
-                )
                 await _approve_block(
                     ws, bi.get("blockId"), bi.get("messageId"), todo_id
                 )
+            for bi in blocks:
+                tl, disp = _block_display(bi)
+                _err(f"\n{YELLOW}⚠ Auto-approving [{tl}]{RESET} {disp}")
             return
 
         n = len(blocks)
@@ -248,8 +361,6 @@ async def watch_todo(
         if watch_task:
             watch_task.cancel()
 
-    old_handler = signal.signal(signal.SIGINT, lambda s, f: handle_interrupt())
-
     try:
         watch_task = asyncio.create_task(
             edge.wait_for_todo_completion(
@@ -260,7 +371,9 @@ async def watch_todo(
                 approval_handler=handle_approval,
             )
         )
-        result = await watch_task
+        with _sigint_scope(handle_interrupt):
+            result = await watch_task
+        out.flush()
         print()
         if not result.get("success"):
             msg_type = result.get("type", "unknown")
@@ -276,4 +389,4 @@ async def watch_todo(
     except asyncio.TimeoutError:
         raise
     finally:
-        signal.signal(signal.SIGINT, old_handler)
+        out.flush()